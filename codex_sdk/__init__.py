@@ -5,6 +5,10 @@ Embed the Codex agent in your workflows and apps.
 
 The Python SDK wraps the bundled `codex` binary. It spawns the CLI and exchanges
 JSONL events over stdin/stdout.
+
+Install the optional ``fast`` extra (``pip install "codex-py[fast]"``) to parse
+events with orjson and, on Linux and macOS, to get uvloop. Run your entry point
+with ``uvloop.run()`` instead of ``asyncio.run()`` to speed up the subprocess I/O.
 """
 
 from .codex import Codex, CodexOptions
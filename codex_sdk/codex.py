@@ -9,6 +9,13 @@ from .thread import Thread, ThreadOptions
 class CodexOptions:
     """Options for configuring the Codex client."""
     
+    __slots__ = (
+        "codex_path_override",
+        "env",
+        "base_url",
+        "api_key",
+    )
+    
     def __init__(
         self,
         codex_path_override: Optional[str] = None,
@@ -20,8 +27,11 @@ class CodexOptions:
         Initialize Codex options.
         
         Args:
-            codex_path_override: Path to the codex binary. If None, will attempt to find it.
-            env: Environment variables to pass to the subprocess.
+            codex_path_override: Path to the codex binary. If None, it is looked up when the first
+                turn runs.
+            env: Environment variables to pass to the subprocess. If None, the subprocess
+                inherits a snapshot of os.environ taken when the client is created; later
+                changes to os.environ do not reach the CLI.
             base_url: Base URL for the API.
             api_key: API key for authentication.
         """
@@ -77,6 +87,9 @@ class Codex:
         Resumes a conversation with an agent based on the thread id.
         Threads are persisted in ~/.codex/sessions.
         
+        This performs no I/O: the CLI loads the saved session when the next turn runs,
+        so calling it repeatedly for the same id is cheap and always sees the latest state.
+        
         Args:
             thread_id: The id of the thread to resume.
             options: Configuration options for the thread.
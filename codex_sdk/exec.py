@@ -1,21 +1,200 @@
 """Execution layer that spawns the Codex CLI binary."""
 
 import asyncio
+import collections
 import os
 import platform
-import subprocess
+import shutil
 import sys
 from pathlib import Path
-from typing import AsyncGenerator, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, AsyncGenerator, Deque, Dict, List, Mapping, Optional, Tuple
 
 
 INTERNAL_ORIGINATOR_ENV = "CODEX_INTERNAL_ORIGINATOR_OVERRIDE"
 PYTHON_SDK_ORIGINATOR = "codex_sdk_py"
 
+# Size of each raw read from the CLI's stdout pipe.
+_READ_CHUNK_SIZE = 1 << 17
+
+# Size of each write of the prompt to the CLI's stdin pipe.
+_WRITE_CHUNK_SIZE = 1 << 16
+
+# Number of trailing stderr lines kept for error messages.
+_STDERR_TAIL_LINES = 256
+
+# Maximum number of trailing bytes kept of each stderr line.
+_STDERR_MAX_LINE_BYTES = 1 << 13
+
+# Requested kernel buffer size for the CLI's stdout pipe (Linux only).
+_PIPE_BUFFER_SIZE = 1 << 20
+# fcntl.F_SETPIPE_SZ is only exposed by Python 3.10+.
+_F_SETPIPE_SZ = 1031
+
+_SYSTEM = platform.system().lower()
+_MACHINE = platform.machine().lower()
+
+# Resolved codex binary paths, keyed by the PATH they were resolved against.
+_PATH_CACHE: Dict[str, str] = {}
+
+
+async def _read_line_batches(
+    reader: asyncio.StreamReader,
+    max_pending: Optional[int] = None,
+) -> AsyncGenerator[List[bytes], None]:
+    """
+    Yield newline-delimited lines from a stream reader, batched per read.
+    
+    Reads the stream in large chunks and splits them in place instead of calling
+    ``readline()`` for every line, which also lifts the reader's line-length limit.
+    Each batch holds the complete lines that became available with one read.
+    Trailing carriage returns and empty lines are dropped.
+    
+    Args:
+        reader: Stream to read from until EOF.
+        max_pending: If set, only the last ``max_pending`` bytes of a line that has
+            not been terminated yet are kept, dropping the start of overlong lines.
+        
+    Yields:
+        Non-empty lists of raw line bytes without the line terminator.
+    """
+    buffer = bytearray()
+    while True:
+        chunk = await reader.read(_READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        # Only search the new data, so a long line is not rescanned on every read
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            buffer += chunk
+            if max_pending is not None and len(buffer) > max_pending:
+                del buffer[:-max_pending]
+            continue
+        end += len(buffer)
+        buffer += chunk
+        lines = buffer[:end].split(b"\n")
+        # Keep only the unterminated remainder after the last newline
+        del buffer[:end + 1]
+        if max_pending is not None and len(buffer) > max_pending:
+            del buffer[:-max_pending]
+        batch = [bytes(line.rstrip(b"\r")) for line in lines]
+        batch = [line for line in batch if line]
+        if batch:
+            yield batch
+    
+    # Flush a final line that was not newline-terminated
+    line = bytes(buffer.rstrip(b"\r"))
+    if line:
+        yield [line]
+
+
+async def _drain_stderr(reader: Optional[asyncio.StreamReader]) -> Deque[bytes]:
+    """
+    Read the CLI's stderr until EOF, keeping only the most recent lines.
+    
+    Each kept line is truncated to its last ``_STDERR_MAX_LINE_BYTES`` bytes, including
+    a line still being written without a newline (such as ``\\r`` progress output),
+    so the retained tail stays bounded in bytes.
+    
+    Args:
+        reader: Stderr stream of the CLI process.
+        
+    Returns:
+        Up to the last ``_STDERR_TAIL_LINES`` lines of stderr.
+    """
+    tail: Deque[bytes] = collections.deque(maxlen=_STDERR_TAIL_LINES)
+    if reader:
+        async for batch in _read_line_batches(reader, _STDERR_MAX_LINE_BYTES):
+            tail.extend(line[-_STDERR_MAX_LINE_BYTES:] for line in batch)
+    return tail
+
+
+async def _write_input(writer: asyncio.StreamWriter, data: bytes) -> None:
+    """
+    Write the prompt to the CLI's stdin in chunks, respecting pipe backpressure, then close it.
+    
+    A CLI that exits before reading all of its input is not treated as an error here;
+    its exit status is reported by the caller instead.
+    """
+    try:
+        for start in range(0, len(data), _WRITE_CHUNK_SIZE):
+            writer.write(data[start:start + _WRITE_CHUNK_SIZE])
+            await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+    except (BrokenPipeError, ConnectionResetError):
+        pass
+
+
+def _open_stdout_pipe() -> Optional[Tuple[int, int]]:
+    """
+    Create the pipe for the CLI's stdout with an enlarged kernel buffer, so a bursty CLI
+    does not block on a full pipe.
+    
+    The SDK creates the pipe itself rather than resizing the one made by the event loop,
+    whose transports (uvloop's in particular) do not expose the underlying file.
+    This is a best-effort optimization: it only applies on Linux, and the kernel
+    may refuse sizes above /proc/sys/fs/pipe-max-size for unprivileged users.
+    
+    Returns:
+        The ``(read_fd, write_fd)`` pair, or None to use a regular subprocess pipe.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    import fcntl
+    
+    read_fd, write_fd = os.pipe()
+    try:
+        fcntl.fcntl(read_fd, getattr(fcntl, "F_SETPIPE_SZ", _F_SETPIPE_SZ), _PIPE_BUFFER_SIZE)
+    except OSError:
+        os.close(read_fd)
+        os.close(write_fd)
+        return None
+    return read_fd, write_fd
+
+
+async def _connect_read_pipe(read_fd: int) -> Tuple[asyncio.StreamReader, asyncio.BaseTransport]:
+    """Wrap the read end of a pipe in a stream reader driven by the running event loop."""
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    transport, _ = await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader),
+        os.fdopen(read_fd, "rb", buffering=0),
+    )
+    return reader, transport
+
+
+async def _cancel_task(task: "asyncio.Task[Any]") -> None:
+    """Cancel a background task if it is still running and wait for it to finish."""
+    if not task.done():
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
 
 class CodexExecArgs:
     """Arguments for executing the Codex CLI."""
     
+    __slots__ = (
+        "input",
+        "base_url",
+        "api_key",
+        "thread_id",
+        "images",
+        "model",
+        "sandbox_mode",
+        "working_directory",
+        "additional_directories",
+        "skip_git_repo_check",
+        "output_schema_file",
+        "model_reasoning_effort",
+        "network_access_enabled",
+        "web_search_enabled",
+        "approval_policy",
+    )
+    
     def __init__(
         self,
         input: str,
@@ -51,6 +230,59 @@ class CodexExecArgs:
         self.approval_policy = approval_policy
 
 
+# CodexExecArgs attributes passed as a single "--flag value" pair when set
+_FLAG_SPECS = (
+    ("model", "--model"),
+    ("sandbox_mode", "--sandbox"),
+    ("working_directory", "--cd"),
+    ("output_schema_file", "--output-schema"),
+)
+
+# CodexExecArgs list attributes passed as one "--flag value" pair per entry
+_REPEATED_FLAG_SPECS = (
+    ("additional_directories", "--add-dir"),
+    ("images", "--image"),
+)
+
+# CodexExecArgs attributes passed as "--config key=value" overrides when set
+_CONFIG_SPECS = (
+    ("model_reasoning_effort", 'model_reasoning_effort="{}"'),
+    ("network_access_enabled", "sandbox_workspace_write.network_access={}"),
+    ("web_search_enabled", "features.web_search_request={}"),
+    ("approval_policy", 'approval_policy="{}"'),
+)
+
+
+def _build_command_args(args: CodexExecArgs) -> List[str]:
+    """Translate execution arguments into the `codex exec` command line."""
+    command_args = ["exec", "--experimental-json"]
+    
+    for attr, flag in _FLAG_SPECS:
+        value = getattr(args, attr)
+        if value:
+            command_args += (flag, value)
+    
+    for attr, flag in _REPEATED_FLAG_SPECS:
+        for value in getattr(args, attr):
+            command_args += (flag, value)
+    
+    if args.skip_git_repo_check:
+        command_args.append("--skip-git-repo-check")
+    
+    for attr, template in _CONFIG_SPECS:
+        value = getattr(args, attr)
+        if value is None or value == "":
+            continue
+        if isinstance(value, bool):
+            value = str(value).lower()
+        command_args += ("--config", template.format(value))
+    
+    if args.thread_id:
+        command_args += ("resume", args.thread_id)
+    
+    return command_args
+
+
 class CodexExec:
     """Handles execution of the Codex CLI binary."""
     
@@ -63,11 +295,43 @@ class CodexExec:
         Initialize the Codex executor.
         
         Args:
-            executable_path: Path to the codex binary. If None, will attempt to find it.
-            env: Environment variables to pass to the subprocess. If None, inherits from current process.
+            executable_path: Path to the codex binary. If None, it is looked up on first use.
+            env: Environment variables to pass to the subprocess. If None, inherits a snapshot of
+                os.environ taken here; later changes to os.environ do not reach the CLI.
         """
-        self.executable_path = executable_path or self._find_codex_path()
-        self.env_override = env
+        self._executable_path = executable_path or None
+        self._env_override = MappingProxyType(dict(env)) if env else None
+        
+        # Build the base environment once; each run only layers per-turn overrides on top
+        self._base_env = dict(env) if env else dict(os.environ)
+        self._base_env.setdefault(INTERNAL_ORIGINATOR_ENV, PYTHON_SDK_ORIGINATOR)
+    
+    @property
+    def env_override(self) -> Optional[Mapping[str, str]]:
+        """
+        Read-only copy of the environment passed at construction, or None if it is inherited.
+        
+        The CLI environment is fixed when the executor is created; create a new
+        executor to change it.
+        """
+        return self._env_override
+    
+    @property
+    def executable_path(self) -> str:
+        """
+        Path to the codex binary, resolved the first time it is needed.
+        
+        Raises:
+            RuntimeError: If the binary cannot be found or platform is unsupported.
+        """
+        if self._executable_path is None:
+            self._executable_path = self._find_codex_path()
+        return self._executable_path
+    
+    @executable_path.setter
+    def executable_path(self, value: Optional[str]) -> None:
+        # None (or an empty path) restores the lookup on next use
+        self._executable_path = value or None
     
     async def run(self, args: CodexExecArgs) -> AsyncGenerator[str, None]:
         """
@@ -82,168 +346,149 @@ class CodexExec:
         Raises:
             RuntimeError: If the Codex CLI exits with a non-zero status.
         """
-        command_args = ["exec", "--experimental-json"]
-        
-        if args.model:
-            command_args.extend(["--model", args.model])
-        
-        if args.sandbox_mode:
-            command_args.extend(["--sandbox", args.sandbox_mode])
-        
-        if args.working_directory:
-            command_args.extend(["--cd", args.working_directory])
-        
-        if args.additional_directories:
-            for dir_path in args.additional_directories:
-                command_args.extend(["--add-dir", dir_path])
-        
-        if args.skip_git_repo_check:
-            command_args.append("--skip-git-repo-check")
-        
-        if args.output_schema_file:
-            command_args.extend(["--output-schema", args.output_schema_file])
-        
-        if args.model_reasoning_effort:
-            command_args.extend([
-                "--config",
-                f'model_reasoning_effort="{args.model_reasoning_effort}"'
-            ])
-        
-        if args.network_access_enabled is not None:
-            command_args.extend([
-                "--config",
-                f"sandbox_workspace_write.network_access={str(args.network_access_enabled).lower()}"
-            ])
-        
-        if args.web_search_enabled is not None:
-            command_args.extend([
-                "--config",
-                f"features.web_search_request={str(args.web_search_enabled).lower()}"
-            ])
-        
-        if args.approval_policy:
-            command_args.extend([
-                "--config",
-                f'approval_policy="{args.approval_policy}"'
-            ])
-        
-        if args.images:
-            for image in args.images:
-                command_args.extend(["--image", image])
-        
-        if args.thread_id:
-            command_args.extend(["resume", args.thread_id])
-        
-        # Prepare environment
-        env = {}
-        if self.env_override:
-            env.update(self.env_override)
-        else:
-            env.update(os.environ)
-        
-        if INTERNAL_ORIGINATOR_ENV not in env:
-            env[INTERNAL_ORIGINATOR_ENV] = PYTHON_SDK_ORIGINATOR
-        
-        if args.base_url:
-            env["OPENAI_BASE_URL"] = args.base_url
-        
-        if args.api_key:
-            env["CODEX_API_KEY"] = args.api_key
-        
-        # Spawn the process using asyncio
-        process = await asyncio.create_subprocess_exec(
-            self.executable_path,
-            *command_args,
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            env=env,
-        )
-        
-        stderr_output = []
+        batches = self.run_batched(args)
+        try:
+            async for batch in batches:
+                for line in batch:
+                    yield line.decode('utf-8', errors='replace')
+        finally:
+            await batches.aclose()
+    
+    async def run_batched(self, args: CodexExecArgs) -> AsyncGenerator[List[bytes], None]:
+        """
+        Execute the Codex CLI and yield JSONL events in batches of raw lines.
         
-        async def capture_stderr():
-            """Capture stderr output asynchronously."""
-            if process.stderr:
-                async for line in process.stderr:
-                    stderr_output.append(line.decode('utf-8', errors='replace'))
+        Each batch contains the lines that were read from stdout together, so
+        consumers can decode them in a tight loop.
         
-        # Start capturing stderr in the background
-        stderr_task = asyncio.create_task(capture_stderr())
+        Args:
+            args: Arguments for the Codex execution.
+            
+        Yields:
+            Lists of JSONL event lines as UTF-8 bytes.
+            
+        Raises:
+            RuntimeError: If the Codex CLI exits with a non-zero status.
+        """
+        command_args = _build_command_args(args)
+        
+        # Prepare environment; the base env is only copied when a turn overrides it
+        env = self._base_env
+        if args.base_url or args.api_key:
+            env = env.copy()
+            if args.base_url:
+                env["OPENAI_BASE_URL"] = args.base_url
+            if args.api_key:
+                env["CODEX_API_KEY"] = args.api_key
+        
+        # Spawn the process using asyncio, writing stdout to an enlarged pipe where possible
+        stdout_pipe = _open_stdout_pipe()
+        try:
+            process = await asyncio.create_subprocess_exec(
+                self.executable_path,
+                *command_args,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=stdout_pipe[1] if stdout_pipe else asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=env,
+            )
+        except BaseException:
+            if stdout_pipe:
+                os.close(stdout_pipe[0])
+            raise
+        finally:
+            # The write end now belongs to the child only
+            if stdout_pipe:
+                os.close(stdout_pipe[1])
+        
+        # Drain stderr in the background so a chatty CLI never blocks on a full pipe
+        stderr_task = asyncio.create_task(_drain_stderr(process.stderr))
+        
+        # Write input to stdin in the background so stdout is drained while a large prompt is sent
+        stdin_task = None
+        if process.stdin:
+            stdin_task = asyncio.create_task(
+                _write_input(process.stdin, args.input.encode('utf-8'))
+            )
         
+        stdout = process.stdout
+        stdout_transport = None
         try:
-            # Write input to stdin
-            if process.stdin:
-                process.stdin.write(args.input.encode('utf-8'))
-                await process.stdin.drain()
-                process.stdin.close()
-                await process.stdin.wait_closed()
+            if stdout_pipe:
+                stdout, stdout_transport = await _connect_read_pipe(stdout_pipe[0])
             
             # Read lines from stdout asynchronously
-            if process.stdout:
-                async for line_bytes in process.stdout:
-                    line = line_bytes.decode('utf-8', errors='replace').rstrip('\n\r')
-                    if line:
-                        yield line
+            if stdout:
+                async for batch in _read_line_batches(stdout):
+                    yield batch
             
             # Wait for process to complete
             return_code = await process.wait()
             
-            # Wait for stderr capture to complete
+            # Wait for the input and stderr tasks to complete
+            if stdin_task:
+                await stdin_task
             await stderr_task
             
             if return_code != 0:
-                stderr_text = ''.join(stderr_output)
+                stderr_text = b"\n".join(stderr_task.result()).decode('utf-8', errors='replace')
                 raise RuntimeError(
                     f"Codex Exec exited with code {return_code}: {stderr_text}"
                 )
         
-        except asyncio.CancelledError:
-            # Handle cancellation gracefully
-            if process.returncode is None:
-                process.terminate()
-                try:
-                    await asyncio.wait_for(process.wait(), timeout=5.0)
-                except asyncio.TimeoutError:
-                    process.kill()
-                    await process.wait()
-            raise
-        
         finally:
-            # Cleanup
-            if not stderr_task.done():
-                stderr_task.cancel()
-                try:
-                    await stderr_task
-                except asyncio.CancelledError:
-                    pass
+            # Cleanup on normal exit, error, cancellation, or early close of the generator
+            if stdin_task:
+                await _cancel_task(stdin_task)
+            await _cancel_task(stderr_task)
             
-            if process.returncode is None:
-                process.terminate()
-                try:
-                    await asyncio.wait_for(process.wait(), timeout=5.0)
-                except asyncio.TimeoutError:
-                    process.kill()
-                    await process.wait()
+            await self._terminate(process)
+            if stdout_transport:
+                stdout_transport.close()
+    
+    @staticmethod
+    async def _terminate(process: asyncio.subprocess.Process) -> None:
+        """Terminate the process if it is still running, killing it after a grace period."""
+        if process.returncode is not None:
+            return
+        process.terminate()
+        try:
+            await asyncio.wait_for(process.wait(), timeout=5.0)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
     
     def _find_codex_path(self) -> str:
         """
         Find the path to the Codex CLI binary.
         
+        The binary is searched on the current process PATH (not the environment
+        snapshot passed to the CLI), and the result is cached for that PATH, so
+        constructing further executors does not repeat the lookup.
+        
         Returns:
             Path to the codex binary.
             
         Raises:
             RuntimeError: If the binary cannot be found or platform is unsupported.
         """
+        search_path = os.environ.get("PATH", "")
+        codex_path = _PATH_CACHE.get(search_path)
+        if codex_path is None:
+            codex_path = self._locate_codex_path()
+            _PATH_CACHE[search_path] = codex_path
+        return codex_path
+    
+    def _locate_codex_path(self) -> str:
+        """Look up the Codex CLI binary in PATH, then among the bundled binaries."""
         # First, check if 'codex' is in PATH
         codex_in_path = self._which_codex()
         if codex_in_path:
             return codex_in_path
         
         # Otherwise, look for a bundled binary
-        system = platform.system().lower()
-        machine = platform.machine().lower()
+        system = _SYSTEM
+        machine = _MACHINE
         
         # Map platform and architecture to target triple
         target_triple = None
@@ -283,15 +528,4 @@ class CodexExec:
     
     def _which_codex(self) -> Optional[str]:
         """Check if codex is available in PATH."""
-        try:
-            result = subprocess.run(
-                ["which", "codex"] if sys.platform != "win32" else ["where", "codex"],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            if result.returncode == 0:
-                return result.stdout.strip().split('\n')[0]
-        except Exception:
-            pass
-        return None
+        return shutil.which("codex")
@@ -1,4 +1,10 @@
-"""Item types that represent actions and messages in a thread."""
+"""
+Item types that represent actions and messages in a thread.
+
+These are TypedDicts, so at runtime items are the plain dicts produced by the JSON
+parser: no conversion step runs per event, and items can be forwarded or
+re-serialized as-is.
+"""
 
 from typing import Any, List, Literal, Optional, Union
 from typing_extensions import TypedDict
@@ -1,15 +1,62 @@
 """Thread management for conversations with the Codex agent."""
 
 import json
+import os
+import re
 import tempfile
+import warnings
 from pathlib import Path
-from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Tuple, Union, cast
 from typing_extensions import TypedDict
 
-from .events import ThreadEvent, Usage
+from .events import (
+    ItemCompletedEvent,
+    ThreadError,
+    ThreadEvent,
+    ThreadStartedEvent,
+    TurnCompletedEvent,
+    TurnFailedEvent,
+    Usage,
+)
 from .exec import CodexExec, CodexExecArgs
 from .items import ThreadItem
 
+_json_loads: Callable[[bytes], Any]
+
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Output schemas are short-lived, so prefer a memory-backed filesystem when available
+_SCHEMA_TEMP_DIR = (
+    "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK | os.X_OK) else None
+)
+
+# Matches the event type when it is the first key of the event object, as the CLI emits it
+_EVENT_TYPE_PATTERN = re.compile(rb'\{\s*"type"\s*:\s*"([^"\\]*)"')
+
+
+def _parse_event(line: bytes) -> ThreadEvent:
+    """Parse a single JSONL event line."""
+    try:
+        return cast(ThreadEvent, _json_loads(line))
+    except ValueError as e:
+        raise RuntimeError(
+            f"Failed to parse event: {line.decode('utf-8', errors='replace')}"
+        ) from e
+
+
+def _event_type(line: bytes) -> str:
+    """Extract the type of a JSONL event line, decoding the full event only as a fallback."""
+    match = _EVENT_TYPE_PATTERN.match(line)
+    if match is not None:
+        return match.group(1).decode("utf-8")
+    return _parse_event(line)["type"]
+
 
 class TextInput(TypedDict):
     """Text input to send to the agent."""
@@ -45,6 +92,18 @@ class StreamedTurn(TypedDict):
 class ThreadOptions:
     """Options for configuring a thread."""
     
+    __slots__ = (
+        "model",
+        "sandbox_mode",
+        "working_directory",
+        "additional_directories",
+        "skip_git_repo_check",
+        "model_reasoning_effort",
+        "network_access_enabled",
+        "web_search_enabled",
+        "approval_policy",
+    )
+    
     def __init__(
         self,
         model: Optional[str] = None,
@@ -65,7 +124,8 @@ class ThreadOptions:
             sandbox_mode: Sandbox mode (e.g., "read-only", "workspace-write", "danger-full-access").
             working_directory: Working directory for the thread.
             additional_directories: Additional directories to allow access to.
-            skip_git_repo_check: Skip Git repository check.
+            skip_git_repo_check: Skip the CLI's Git repository check. The check runs inside the
+                CLI when a turn starts; creating a thread never probes the filesystem.
             model_reasoning_effort: Reasoning effort level (e.g., "low", "medium", "high").
             network_access_enabled: Enable network access in the sandbox.
             web_search_enabled: Enable web search feature.
@@ -85,6 +145,10 @@ class ThreadOptions:
 class TurnOptions:
     """Options for a single turn in a thread."""
     
+    __slots__ = (
+        "output_schema",
+    )
+    
     def __init__(self, output_schema: Optional[Dict[str, Any]] = None):
         """
         Initialize turn options.
@@ -95,6 +159,45 @@ class TurnOptions:
         self.output_schema = output_schema
 
 
+class _TurnState:
+    """Accumulates the result of a buffered turn while its events are consumed."""
+    
+    def __init__(self, collect_items: bool):
+        self.collect_items = collect_items
+        self.items: List[ThreadItem] = []
+        self.final_response = ""
+        self.usage: Optional[Usage] = None
+        self.failure: Optional[ThreadError] = None
+    
+    def on_item_completed(self, event: ItemCompletedEvent) -> bool:
+        """Record a completed item, tracking the latest agent message as the response."""
+        item = event["item"]
+        if item["type"] == "agent_message":
+            self.final_response = item.get("text", "")
+        if self.collect_items:
+            self.items.append(item)
+        return False
+    
+    def on_turn_completed(self, event: TurnCompletedEvent) -> bool:
+        """Record the token usage reported for the turn."""
+        self.usage = event["usage"]
+        return False
+    
+    def on_turn_failed(self, event: TurnFailedEvent) -> bool:
+        """Record the turn failure and stop consuming events."""
+        self.failure = event["error"]
+        return True
+
+
+# Handlers for the event types that contribute to a buffered turn, keyed by event type.
+# Each handler returns True when the turn is over and no further events should be read.
+_TURN_EVENT_HANDLERS: Dict[str, Callable[[_TurnState, Any], bool]] = {
+    "item.completed": _TurnState.on_item_completed,
+    "turn.completed": _TurnState.on_turn_completed,
+    "turn.failed": _TurnState.on_turn_failed,
+}
+
+
 class Thread:
     """Represents a thread of conversation with the agent. One thread can have multiple consecutive turns."""
     
@@ -120,6 +223,7 @@ class Thread:
         self._base_url = base_url
         self._api_key = api_key
         self._id = thread_id
+        # Options are only read, never mutated, so callers may share one instance across threads
         self._options = options or ThreadOptions()
     
     @property
@@ -127,7 +231,7 @@ class Thread:
         """Returns the ID of the thread. Populated after the first turn starts."""
         return self._id
     
-    async def run_streamed(
+    def run_streamed(
         self,
         input: Input,
         options: Optional[TurnOptions] = None,
@@ -135,6 +239,8 @@ class Thread:
         """
         Provides the input to the agent and streams events as they are produced during the turn.
         
+        The turn starts when the returned events generator is first iterated.
+        
         Args:
             input: Input to send to the agent (string or list of structured inputs).
             options: Options for this turn.
@@ -150,24 +256,87 @@ class Thread:
         options: Optional[TurnOptions] = None,
     ) -> AsyncGenerator[ThreadEvent, None]:
         """Internal implementation of run_streamed."""
+        batches = self._run_batched(input, options)
+        try:
+            async for events in batches:
+                for event in events:
+                    yield event
+        finally:
+            await batches.aclose()
+    
+    async def run_streamed_raw(
+        self,
+        input: Input,
+        options: Optional[TurnOptions] = None,
+    ) -> AsyncGenerator[Tuple[str, bytes], None]:
+        """
+        Provides the input to the agent and streams the raw JSONL events of the turn.
+        
+        Events are not decoded into dicts; only their type is extracted. This suits
+        consumers that forward events verbatim, such as to a log, socket, or queue.
+        
+        Args:
+            input: Input to send to the agent (string or list of structured inputs).
+            options: Options for this turn.
+            
+        Yields:
+            Tuples of (event type, event JSON as UTF-8 bytes).
+        """
+        batches = self._run_lines(input, options)
+        try:
+            async for batch in batches:
+                for line in batch:
+                    event_type = _event_type(line)
+                    if event_type == "thread.started":
+                        self._id = cast(ThreadStartedEvent, _parse_event(line))["thread_id"]
+                    yield event_type, line
+        finally:
+            await batches.aclose()
+    
+    async def _run_batched(
+        self,
+        input: Input,
+        options: Optional[TurnOptions] = None,
+    ) -> AsyncGenerator[List[ThreadEvent], None]:
+        """Run a turn and yield its events in the batches they were read from the CLI."""
+        batches = self._run_lines(input, options)
+        try:
+            async for batch in batches:
+                events = []
+                for line in batch:
+                    event = _parse_event(line)
+                    # Update thread ID from the first event
+                    if event["type"] == "thread.started":
+                        self._id = cast(ThreadStartedEvent, event)["thread_id"]
+                    events.append(event)
+                
+                yield events
+        finally:
+            await batches.aclose()
+    
+    async def _run_lines(
+        self,
+        input: Input,
+        options: Optional[TurnOptions] = None,
+    ) -> AsyncGenerator[List[bytes], None]:
+        """Run a turn and yield its raw JSONL lines in the batches they were read from the CLI."""
         turn_options = options or TurnOptions()
         
         # Handle output schema with secure permissions
         schema_file_path = None
-        temp_file = None
         try:
             if turn_options.output_schema:
                 # Create temp file with restricted permissions (owner read/write only)
                 # mkstemp creates files with 0o600 permissions by default for security
-                import os
                 fd, schema_file_path = tempfile.mkstemp(
                     suffix='.json',
                     prefix='codex_schema_',
+                    dir=_SCHEMA_TEMP_DIR,
                     text=True,
                 )
                 # Write schema to the temp file
                 with os.fdopen(fd, 'w') as temp_file:
-                    json.dump(turn_options.output_schema, temp_file)
+                    json.dump(turn_options.output_schema, temp_file, separators=(',', ':'))
             
             # Normalize input
             prompt, images = self._normalize_input(input)
@@ -192,17 +361,12 @@ class Thread:
             )
             
             # Execute and yield events
-            async for line in self._exec.run(exec_args):
-                try:
-                    event = json.loads(line)
-                except json.JSONDecodeError as e:
-                    raise RuntimeError(f"Failed to parse event: {line}") from e
-                
-                # Update thread ID from the first event
-                if event.get("type") == "thread.started":
-                    self._id = event.get("thread_id")
-                
-                yield event
+            batches = self._exec.run_batched(exec_args)
+            try:
+                async for batch in batches:
+                    yield batch
+            finally:
+                await batches.aclose()
         
         finally:
             # Cleanup temp file with specific error handling
@@ -214,17 +378,16 @@ class Thread:
                     pass
                 except PermissionError as e:
                     # Log permission errors but don't fail
-                    import warnings
                     warnings.warn(f"Could not delete temp schema file: {e}", RuntimeWarning)
                 except OSError as e:
                     # Log other OS errors
-                    import warnings
                     warnings.warn(f"Error deleting temp schema file: {e}", RuntimeWarning)
     
     async def run(
         self,
         input: Input,
         options: Optional[TurnOptions] = None,
+        collect_items: bool = True,
     ) -> Turn:
         """
         Provides the input to the agent and returns the completed turn.
@@ -232,6 +395,9 @@ class Thread:
         Args:
             input: Input to send to the agent (string or list of structured inputs).
             options: Options for this turn.
+            collect_items: Whether to keep the completed items. When False, the returned
+                turn has an empty items list, which saves memory when only the final
+                response and usage are needed.
             
         Returns:
             Completed turn with items, final response, and usage.
@@ -239,36 +405,33 @@ class Thread:
         Raises:
             RuntimeError: If the turn fails.
         """
-        items: List[ThreadItem] = []
-        final_response = ""
-        usage: Optional[Usage] = None
-        turn_failure = None
+        state = _TurnState(collect_items)
+        handlers = _TURN_EVENT_HANDLERS
         
-        async for event in self._run_streamed_internal(input, options):
-            event_type = event.get("type")
-            
-            if event_type == "item.completed":
-                item = event.get("item")
-                if item and item.get("type") == "agent_message":
-                    final_response = item.get("text", "")
-                if item:
-                    items.append(item)
-            elif event_type == "turn.completed":
-                usage = event.get("usage")
-            elif event_type == "turn.failed":
-                turn_failure = event.get("error")
-                break
+        batches = self._run_batched(input, options)
+        try:
+            done = False
+            async for events in batches:
+                for event in events:
+                    handler = handlers.get(event["type"])
+                    if handler is not None and handler(state, event):
+                        done = True
+                        break
+                if done:
+                    break
+        finally:
+            await batches.aclose()
         
-        if turn_failure:
-            raise RuntimeError(turn_failure.get("message", "Turn failed"))
+        if state.failure is not None:
+            raise RuntimeError(state.failure.get("message", "Turn failed"))
         
         return {
-            "items": items,
-            "final_response": final_response,
-            "usage": usage,
+            "items": state.items,
+            "final_response": state.final_response,
+            "usage": state.usage,
         }
     
-    def _normalize_input(self, input: Input) -> tuple[str, List[str]]:
+    def _normalize_input(self, input: Input) -> Tuple[str, List[str]]:
         """
         Normalize input into prompt text and image paths.
         
@@ -281,13 +444,20 @@ class Thread:
         if isinstance(input, str):
             return input, []
         
+        # Fast path for the common single text entry
+        if len(input) == 1 and input[0].get("type") == "text":
+            return cast(TextInput, input[0]).get("text", ""), []
+        
         prompt_parts: List[str] = []
         images: List[str] = []
+        add_prompt_part = prompt_parts.append
+        add_image = images.append
         
         for item in input:
-            if item.get("type") == "text":
-                prompt_parts.append(item.get("text", ""))
-            elif item.get("type") == "local_image":
-                images.append(item.get("path", ""))
+            item_type = item.get("type")
+            if item_type == "text":
+                add_prompt_part(cast(TextInput, item).get("text", ""))
+            elif item_type == "local_image":
+                add_image(cast(LocalImageInput, item).get("path", ""))
         
         return "\n\n".join(prompt_parts), images
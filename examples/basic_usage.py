@@ -41,4 +41,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop speeds up subprocess and stream I/O; install it with `pip install "codex-py[fast]"`
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -1,20 +1,64 @@
 """Example showing various configuration options for the Codex SDK."""
 
-import asyncio
+import functools
 import os
 from codex_sdk import Codex
 from codex_sdk.codex import CodexOptions
 from codex_sdk.thread import ThreadOptions
 
 
-async def basic_config():
+# Options without per-call values are built once and shared. Threads only read their
+# options, so one instance can safely back any number of threads.
+READ_ONLY_OPTIONS = ThreadOptions(sandbox_mode="read-only")
+WORKSPACE_WRITE_OPTIONS = ThreadOptions(sandbox_mode="workspace-write")
+WORKSPACE_WRITE_NETWORK_OPTIONS = ThreadOptions(
+    sandbox_mode="workspace-write",
+    network_access_enabled=True,
+)
+GPT4_OPTIONS = ThreadOptions(model="gpt-4")  # or "gpt-4-turbo", "gpt-3.5-turbo", etc.
+HIGH_REASONING_OPTIONS = ThreadOptions(model_reasoning_effort="high")  # "low", "medium", "high"
+AUTO_APPROVAL_OPTIONS = ThreadOptions(approval_policy="auto")
+MANUAL_APPROVAL_OPTIONS = ThreadOptions(approval_policy="manual")
+WEB_SEARCH_OPTIONS = ThreadOptions(web_search_enabled=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _env(name):
+    """Read an environment variable once and reuse the value."""
+    return os.getenv(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _home():
+    """Resolve the user's home directory once and reuse the value."""
+    return os.path.expanduser("~")
+
+
+@functools.lru_cache(maxsize=None)
+def _cwd():
+    """Read the current working directory once and reuse the value."""
+    return os.getcwd()
+
+
+def refresh_env_cache():
+    """Forget cached environment lookups, e.g. after a test changes the environment."""
+    _env.cache_clear()
+    _home.cache_clear()
+
+
+def refresh_cwd():
+    """Forget the cached working directory, e.g. after a test calls os.chdir()."""
+    _cwd.cache_clear()
+
+
+def basic_config():
     """Example of basic configuration."""
     print("=== Basic Configuration ===")
     
     # Configure the Codex client with API settings
     codex_options = CodexOptions(
-        base_url=os.getenv("OPENAI_BASE_URL"),  # Optional: custom API endpoint
-        api_key=os.getenv("CODEX_API_KEY"),     # Optional: API key
+        base_url=_env("OPENAI_BASE_URL"),  # Optional: custom API endpoint
+        api_key=_env("CODEX_API_KEY"),     # Optional: API key
     )
     
     codex = Codex(options=codex_options)
@@ -23,7 +67,7 @@ async def basic_config():
     print("✓ Codex client configured with API settings")
 
 
-async def custom_binary_path():
+def custom_binary_path():
     """Example of specifying a custom codex binary path."""
     print("\n=== Custom Binary Path ===")
     
@@ -35,14 +79,14 @@ async def custom_binary_path():
     print("✓ Using custom codex binary path")
 
 
-async def environment_control():
+def environment_control():
     """Example of controlling the subprocess environment."""
     print("\n=== Environment Control ===")
     
     # Provide a custom environment for the codex subprocess
     custom_env = {
         "PATH": "/usr/local/bin:/usr/bin:/bin",
-        "HOME": os.path.expanduser("~"),
+        "HOME": _home(),
         "CUSTOM_VAR": "value",
     }
     
@@ -52,47 +96,46 @@ async def environment_control():
     print("✓ Codex subprocess configured with custom environment")
 
 
-async def sandbox_configuration():
+def sandbox_configuration():
     """Example of different sandbox modes."""
     print("\n=== Sandbox Configuration ===")
     
     codex = Codex()
     
     # Read-only sandbox (default, safest)
-    print("\n1. Read-only sandbox:")
-    thread_ro = codex.start_thread(
-        options=ThreadOptions(sandbox_mode="read-only")
-    )
-    print("   - Agent can read files but cannot modify them")
-    print("   - No network access")
+    thread_ro = codex.start_thread(options=READ_ONLY_OPTIONS)
+    print("\n".join([
+        "\n1. Read-only sandbox:",
+        "   - Agent can read files but cannot modify them",
+        "   - No network access",
+    ]))
     
     # Workspace-write sandbox
-    print("\n2. Workspace-write sandbox:")
-    thread_ww = codex.start_thread(
-        options=ThreadOptions(sandbox_mode="workspace-write")
-    )
-    print("   - Agent can write within the working directory")
-    print("   - No network access by default")
+    thread_ww = codex.start_thread(options=WORKSPACE_WRITE_OPTIONS)
+    print("\n".join([
+        "\n2. Workspace-write sandbox:",
+        "   - Agent can write within the working directory",
+        "   - No network access by default",
+    ]))
     
     # Workspace-write with network access
-    print("\n3. Workspace-write with network:")
-    thread_ww_net = codex.start_thread(
-        options=ThreadOptions(
-            sandbox_mode="workspace-write",
-            network_access_enabled=True,
-        )
-    )
-    print("   - Agent can write within the working directory")
-    print("   - Network access enabled")
+    thread_ww_net = codex.start_thread(options=WORKSPACE_WRITE_NETWORK_OPTIONS)
+    print("\n".join([
+        "\n3. Workspace-write with network:",
+        "   - Agent can write within the working directory",
+        "   - Network access enabled",
+    ]))
     
     # Full access (dangerous, use only in containers)
-    print("\n4. Full access (DANGER):")
-    print("   options=ThreadOptions(sandbox_mode='danger-full-access')")
-    print("   - Agent has full system access")
-    print("   - Only use in isolated environments!")
+    print("\n".join([
+        "\n4. Full access (DANGER):",
+        "   options=ThreadOptions(sandbox_mode='danger-full-access')",
+        "   - Agent has full system access",
+        "   - Only use in isolated environments!",
+    ]))
 
 
-async def working_directory_config():
+def working_directory_config():
     """Example of configuring working directory."""
     print("\n=== Working Directory Configuration ===")
     
@@ -102,14 +145,14 @@ async def working_directory_config():
     thread = codex.start_thread(
         options=ThreadOptions(
             working_directory="/path/to/project",
-            skip_git_repo_check=True,  # Skip Git repo requirement
+            skip_git_repo_check=True,  # Skip Git repo requirement (checked by the CLI per turn)
         )
     )
     
     print("✓ Thread configured with custom working directory")
 
 
-async def multi_directory_access():
+def multi_directory_access():
     """Example of allowing access to multiple directories."""
     print("\n=== Multi-Directory Access ===")
     
@@ -130,84 +173,64 @@ async def multi_directory_access():
     print("✓ Thread configured with access to multiple directories")
 
 
-async def model_configuration():
+def model_configuration():
     """Example of model configuration."""
     print("\n=== Model Configuration ===")
     
     codex = Codex()
     
     # Use a specific model
-    thread = codex.start_thread(
-        options=ThreadOptions(
-            model="gpt-4",  # or "gpt-4-turbo", "gpt-3.5-turbo", etc.
-        )
-    )
+    thread = codex.start_thread(options=GPT4_OPTIONS)
     
     print("✓ Thread configured with specific model")
 
 
-async def reasoning_effort():
+def reasoning_effort():
     """Example of configuring reasoning effort."""
     print("\n=== Reasoning Effort Configuration ===")
     
     codex = Codex()
     
     # Configure reasoning effort level
-    thread = codex.start_thread(
-        options=ThreadOptions(
-            model_reasoning_effort="high",  # "low", "medium", "high"
-        )
-    )
+    thread = codex.start_thread(options=HIGH_REASONING_OPTIONS)
     
     print("✓ Thread configured with high reasoning effort")
 
 
-async def approval_policy():
+def approval_policy():
     """Example of approval policy configuration."""
     print("\n=== Approval Policy Configuration ===")
     
     codex = Codex()
     
     # Auto-approve all actions
-    thread_auto = codex.start_thread(
-        options=ThreadOptions(
-            approval_policy="auto",
-        )
-    )
+    thread_auto = codex.start_thread(options=AUTO_APPROVAL_OPTIONS)
     print("✓ Thread configured with auto-approval")
     
     # Manual approval required
-    thread_manual = codex.start_thread(
-        options=ThreadOptions(
-            approval_policy="manual",
-        )
-    )
+    thread_manual = codex.start_thread(options=MANUAL_APPROVAL_OPTIONS)
     print("✓ Thread configured with manual approval")
 
 
-async def web_search():
+def web_search():
     """Example of enabling web search."""
     print("\n=== Web Search Configuration ===")
     
     codex = Codex()
     
     # Enable web search feature
-    thread = codex.start_thread(
-        options=ThreadOptions(
-            web_search_enabled=True,
-        )
-    )
+    thread = codex.start_thread(options=WEB_SEARCH_OPTIONS)
     
     print("✓ Thread configured with web search enabled")
 
 
-async def complete_example():
+def complete_example():
     """Example combining multiple configuration options."""
     print("\n=== Complete Configuration Example ===")
     
     codex_options = CodexOptions(
-        base_url=os.getenv("OPENAI_BASE_URL"),
-        api_key=os.getenv("CODEX_API_KEY"),
+        base_url=_env("OPENAI_BASE_URL"),
+        api_key=_env("CODEX_API_KEY"),
     )
     
     codex = Codex(options=codex_options)
@@ -216,7 +239,7 @@ async def complete_example():
         options=ThreadOptions(
             model="gpt-4",
             sandbox_mode="workspace-write",
-            working_directory=os.getcwd(),
+            working_directory=_cwd(),
             additional_directories=["/tmp/shared"],
             skip_git_repo_check=False,
             model_reasoning_effort="medium",
@@ -226,35 +249,43 @@ async def complete_example():
         )
     )
     
-    print("✓ Thread configured with comprehensive settings:")
-    print("  - Model: gpt-4")
-    print("  - Sandbox: workspace-write")
-    print("  - Working dir: current directory")
-    print("  - Additional dirs: /tmp/shared")
-    print("  - Git check: enabled")
-    print("  - Reasoning: medium")
-    print("  - Network: disabled")
-    print("  - Web search: enabled")
-    print("  - Approval: auto")
-
-
-async def main():
-    """Run all configuration examples."""
-    await basic_config()
-    await custom_binary_path()
-    await environment_control()
-    await sandbox_configuration()
-    await working_directory_config()
-    await multi_directory_access()
-    await model_configuration()
-    await reasoning_effort()
-    await approval_policy()
-    await web_search()
-    await complete_example()
-    
-    print("\n" + "="*50)
-    print("All configuration examples completed!")
+    print("\n".join([
+        "✓ Thread configured with comprehensive settings:",
+        "  - Model: gpt-4",
+        "  - Sandbox: workspace-write",
+        "  - Working dir: current directory",
+        "  - Additional dirs: /tmp/shared",
+        "  - Git check: enabled",
+        "  - Reasoning: medium",
+        "  - Network: disabled",
+        "  - Web search: enabled",
+        "  - Approval: auto",
+    ]))
+
+
+def main():
+    """
+    Run all configuration examples.
+    
+    Creating clients and threads is synchronous; only running turns needs an event loop.
+    """
+    basic_config()
+    custom_binary_path()
+    environment_control()
+    sandbox_configuration()
+    working_directory_config()
+    multi_directory_access()
+    model_configuration()
+    reasoning_effort()
+    approval_policy()
+    web_search()
+    complete_example()
+    
+    print("\n".join([
+        "\n" + "="*50,
+        "All configuration examples completed!",
+    ]))
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
@@ -24,7 +24,7 @@ async def main():
     print("\n=== Simulating process restart ===")
     print("(In a real scenario, save the thread_id to environment or database)")
     
-    # Resume the thread using the ID
+    # Resume the thread using the ID (no I/O happens until the next turn runs)
     print("\n=== Resuming the thread ===")
     resumed_thread = codex.resume_thread(thread_id)
     
@@ -4,6 +4,141 @@ import asyncio
 from codex_sdk import Codex
 
 
+def _on_thread_started(event):
+    print(f"✓ Thread started: {event['thread_id']}")
+
+
+def _on_turn_started(event):
+    print("✓ Turn started")
+
+
+def _on_command_started(item):
+    print(f"  Command: {item['command']}")
+
+
+# Minimum amount of new command output before another preview is printed
+_OUTPUT_PREVIEW_THRESHOLD = 32
+
+# How often coalesced command output previews are printed, in seconds
+_OUTPUT_FLUSH_INTERVAL = 0.05
+
+# Length of each command's output already previewed, keyed by item id
+_previewed_output_len = {}
+
+# Latest not yet previewed state of each running command, keyed by item id
+_pending_output = {}
+
+
+def _preview_output(item, force=False):
+    output = item["aggregated_output"]
+    shown = _previewed_output_len.get(item["id"], 0)
+    # Debounce intermediate updates, but always show whatever is left when forced
+    if len(output) - shown < (1 if force else _OUTPUT_PREVIEW_THRESHOLD):
+        return
+    # Preview only the output that arrived since the last preview
+    print(f"  Output: {output[shown:shown + 100]}...")
+    _previewed_output_len[item["id"]] = len(output)
+
+
+def _flush_pending_output():
+    for item in _pending_output.values():
+        _preview_output(item)
+    _pending_output.clear()
+
+
+async def _flush_output_loop(stop):
+    """Print coalesced command output previews periodically until `stop` is set."""
+    while not stop.is_set():
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=_OUTPUT_FLUSH_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+        _flush_pending_output()
+
+
+def _on_command_updated(item):
+    # Only keep the latest state; _flush_output_loop prints it at most once per interval
+    _pending_output[item["id"]] = item
+
+
+def _on_agent_message_completed(item):
+    print(f"\n=== Agent Response ===")
+    print(item["text"])
+
+
+def _on_command_completed(item):
+    _previewed_output_len.pop(item["id"], None)
+    print(f"  Exit code: {item.get('exit_code', 'N/A')}")
+
+
+def _on_file_change_completed(item):
+    print(f"  Files changed: {len(item['changes'])}")
+    for change in item["changes"]:
+        print(f"    - {change['kind']}: {change['path']}")
+
+
+def _noop(payload):
+    pass
+
+
+# Per-item-type handlers for each item lifecycle event
+_ITEM_STARTED_HANDLERS = {
+    "command_execution": _on_command_started,
+}
+_ITEM_UPDATED_HANDLERS = {
+    "command_execution": _on_command_updated,
+}
+_ITEM_COMPLETED_HANDLERS = {
+    "agent_message": _on_agent_message_completed,
+    "command_execution": _on_command_completed,
+    "file_change": _on_file_change_completed,
+}
+
+
+def _on_item_started(event):
+    item = event["item"]
+    print(f"→ Item started: {item['type']}")
+    _ITEM_STARTED_HANDLERS.get(item["type"], _noop)(item)
+
+
+def _on_item_updated(event):
+    item = event["item"]
+    _ITEM_UPDATED_HANDLERS.get(item["type"], _noop)(item)
+
+
+def _on_item_completed(event):
+    item = event["item"]
+    # Show any output not yet previewed before the completion line, however short
+    _pending_output.pop(item.get("id"), None)
+    if item["type"] == "command_execution":
+        _preview_output(item, force=True)
+    print(f"✓ Item completed: {item['type']}")
+    _ITEM_COMPLETED_HANDLERS.get(item["type"], _noop)(item)
+
+
+def _on_turn_completed(event):
+    usage = event["usage"]
+    print(f"\n✓ Turn completed")
+    print(f"  Token usage: {usage['input_tokens']} in, {usage['output_tokens']} out")
+
+
+def _on_turn_failed(event):
+    error = event["error"]
+    print(f"✗ Turn failed: {error['message']}")
+
+
+# Event handlers keyed by event type, so each event is dispatched with one dict lookup
+_EVENT_HANDLERS = {
+    "thread.started": _on_thread_started,
+    "turn.started": _on_turn_started,
+    "item.started": _on_item_started,
+    "item.updated": _on_item_updated,
+    "item.completed": _on_item_completed,
+    "turn.completed": _on_turn_completed,
+    "turn.failed": _on_turn_failed,
+}
+
+
 async def main():
     """Run a streaming example using the Codex SDK."""
     # Initialize the Codex client
@@ -16,53 +151,18 @@ async def main():
     print("Running query with streaming: 'Analyze this Python project structure'")
     print("\n=== Streaming Events ===\n")
     
-    result = await thread.run_streamed("Analyze this Python project structure")
+    result = thread.run_streamed("Analyze this Python project structure")
+    
+    # Coalesce command output updates in the background until the turn ends
+    stop_flushing = asyncio.Event()
+    flusher = asyncio.create_task(_flush_output_loop(stop_flushing))
     
-    async for event in result["events"]:
-        event_type = event["type"]
-        
-        if event_type == "thread.started":
-            print(f"✓ Thread started: {event['thread_id']}")
-        
-        elif event_type == "turn.started":
-            print("✓ Turn started")
-        
-        elif event_type == "item.started":
-            item = event["item"]
-            item_type = item["type"]
-            print(f"→ Item started: {item_type}")
-            
-            if item_type == "command_execution":
-                print(f"  Command: {item['command']}")
-        
-        elif event_type == "item.updated":
-            item = event["item"]
-            if item["type"] == "command_execution":
-                print(f"  Output: {item['aggregated_output'][:100]}...")
-        
-        elif event_type == "item.completed":
-            item = event["item"]
-            item_type = item["type"]
-            print(f"✓ Item completed: {item_type}")
-            
-            if item_type == "agent_message":
-                print(f"\n=== Agent Response ===")
-                print(item["text"])
-            elif item_type == "command_execution":
-                print(f"  Exit code: {item.get('exit_code', 'N/A')}")
-            elif item_type == "file_change":
-                print(f"  Files changed: {len(item['changes'])}")
-                for change in item["changes"]:
-                    print(f"    - {change['kind']}: {change['path']}")
-        
-        elif event_type == "turn.completed":
-            usage = event["usage"]
-            print(f"\n✓ Turn completed")
-            print(f"  Token usage: {usage['input_tokens']} in, {usage['output_tokens']} out")
-        
-        elif event_type == "turn.failed":
-            error = event["error"]
-            print(f"✗ Turn failed: {error['message']}")
+    try:
+        async for event in result["events"]:
+            _EVENT_HANDLERS.get(event["type"], _noop)(event)
+    finally:
+        stop_flushing.set()
+        await flusher
 
 
 if __name__ == "__main__":
@@ -1,9 +1,60 @@
 """Example showing how to use structured output with JSON schema."""
 
 import asyncio
-import json
+import functools
 from codex_sdk import Codex, TurnOptions
 
+# Prefer orjson (installed with the "fast" extra) and fall back to the standard library
+try:
+    import orjson
+    
+    _loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+    
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+except ImportError:
+    import json
+    
+    _loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+    
+    def _dumps(obj):
+        return json.dumps(obj, indent=2)
+
+
+# JSON schema for the output, built and pretty-printed once
+_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "summary": {
+            "type": "string",
+            "description": "A brief summary of the repository"
+        },
+        "file_count": {
+            "type": "integer",
+            "description": "Total number of files"
+        },
+        "primary_language": {
+            "type": "string",
+            "description": "The primary programming language"
+        },
+        "status": {
+            "type": "string",
+            "enum": ["healthy", "needs_attention", "critical"],
+            "description": "Overall status of the repository"
+        },
+        "issues": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "List of issues found"
+        }
+    },
+    "required": ["summary", "file_count", "primary_language", "status"],
+    "additionalProperties": False
+}
+_SCHEMA_PRETTY = _dumps(_SCHEMA)
+
 
 async def main():
     """Run a structured output example using the Codex SDK."""
@@ -13,51 +64,20 @@ async def main():
     # Start a new conversation thread
     thread = codex.start_thread()
     
-    # Define a JSON schema for the output
-    schema = {
-        "type": "object",
-        "properties": {
-            "summary": {
-                "type": "string",
-                "description": "A brief summary of the repository"
-            },
-            "file_count": {
-                "type": "integer",
-                "description": "Total number of files"
-            },
-            "primary_language": {
-                "type": "string",
-                "description": "The primary programming language"
-            },
-            "status": {
-                "type": "string",
-                "enum": ["healthy", "needs_attention", "critical"],
-                "description": "Overall status of the repository"
-            },
-            "issues": {
-                "type": "array",
-                "items": {"type": "string"},
-                "description": "List of issues found"
-            }
-        },
-        "required": ["summary", "file_count", "primary_language", "status"],
-        "additionalProperties": False
-    }
-    
     # Run a query with structured output
     print("Running query with structured output schema...")
-    print(f"Schema: {json.dumps(schema, indent=2)}\n")
+    print(f"Schema: {_SCHEMA_PRETTY}\n")
     
     turn = await thread.run(
         "Analyze this repository and provide a structured summary",
-        options=TurnOptions(output_schema=schema)
+        options=TurnOptions(output_schema=_SCHEMA)
     )
     
     # Parse the JSON response
     print("=== Structured Response ===")
     try:
-        response_data = json.loads(turn["final_response"])
-        print(json.dumps(response_data, indent=2))
+        response_data = _loads(turn["final_response"])
+        print(_dumps(response_data))
         
         # Access structured data
         print("\n=== Parsed Data ===")
@@ -70,48 +90,63 @@ async def main():
             for issue in response_data["issues"]:
                 print(f"  - {issue}")
     
-    except json.JSONDecodeError:
+    except _JSONDecodeError:
         print("Response is not valid JSON:")
         print(turn["final_response"])
 
 
+@functools.lru_cache(maxsize=None)
+def _repository_analysis_model():
+    """Define the Pydantic model on first use, so pydantic is only imported when needed."""
+    from typing import List, Literal
+    
+    from pydantic import BaseModel, Field
+    
+    class RepositoryAnalysis(BaseModel):
+        summary: str = Field(description="A brief summary of the repository")
+        file_count: int = Field(description="Total number of files")
+        primary_language: str = Field(description="The primary programming language")
+        status: Literal["healthy", "needs_attention", "critical"] = Field(
+            description="Overall status of the repository"
+        )
+        issues: List[str] = Field(default=[], description="List of issues found")
+    
+    return RepositoryAnalysis
+
+
+@functools.lru_cache(maxsize=None)
+def _repository_analysis_schema():
+    """Generate the JSON schema of the Pydantic model once, on first use."""
+    return _repository_analysis_model().model_json_schema()
+
+
 async def pydantic_example():
     """Example using Pydantic for schema definition (if installed)."""
     try:
-        from pydantic import BaseModel, Field
-        from typing import List, Literal
-        
-        class RepositoryAnalysis(BaseModel):
-            summary: str = Field(description="A brief summary of the repository")
-            file_count: int = Field(description="Total number of files")
-            primary_language: str = Field(description="The primary programming language")
-            status: Literal["healthy", "needs_attention", "critical"] = Field(
-                description="Overall status of the repository"
-            )
-            issues: List[str] = Field(default=[], description="List of issues found")
-        
-        codex = Codex()
-        thread = codex.start_thread()
-        
-        # Convert Pydantic model to JSON schema
-        schema = RepositoryAnalysis.model_json_schema()
-        
-        print("\n" + "="*50)
-        print("Running with Pydantic schema...")
-        
-        turn = await thread.run(
-            "Analyze this repository and provide a structured summary",
-            options=TurnOptions(output_schema=schema)
-        )
-        
-        # Parse into Pydantic model
-        response_data = RepositoryAnalysis.model_validate_json(turn["final_response"])
-        
-        print("\n=== Pydantic Model ===")
-        print(response_data.model_dump_json(indent=2))
-    
+        RepositoryAnalysis = _repository_analysis_model()
     except ImportError:
         print("\n(Pydantic not installed - skipping Pydantic example)")
+        return
+    
+    codex = Codex()
+    thread = codex.start_thread()
+    
+    # Convert Pydantic model to JSON schema
+    schema = _repository_analysis_schema()
+    
+    print("\n" + "="*50)
+    print("Running with Pydantic schema...")
+    
+    turn = await thread.run(
+        "Analyze this repository and provide a structured summary",
+        options=TurnOptions(output_schema=schema)
+    )
+    
+    # Parse into Pydantic model
+    response_data = RepositoryAnalysis.model_validate_json(turn["final_response"])
+    
+    print("\n=== Pydantic Model ===")
+    print(response_data.model_dump_json(indent=2))
 
 
 if __name__ == "__main__":
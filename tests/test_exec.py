@@ -0,0 +1,228 @@
+"""Tests for the CLI execution layer."""
+
+import asyncio
+import sys
+
+import pytest
+
+from codex_sdk import exec as exec_module
+from codex_sdk.exec import (
+    CodexExec,
+    CodexExecArgs,
+    _build_command_args,
+    _drain_stderr,
+    _read_line_batches,
+)
+
+
+def _reader(*chunks: bytes) -> asyncio.StreamReader:
+    """Create a stream reader pre-filled with the given chunks."""
+    reader = asyncio.StreamReader()
+    for chunk in chunks:
+        reader.feed_data(chunk)
+    reader.feed_eof()
+    return reader
+
+
+async def _collect(reader: asyncio.StreamReader) -> list:
+    return [line async for batch in _read_line_batches(reader) for line in batch]
+
+
+async def test_read_lines_splits_across_chunks():
+    """Test that lines split across chunk boundaries are reassembled."""
+    reader = _reader(b'{"a": 1}\n{"b"', b': 2}\r\n\n{"c": 3}')
+    assert await _collect(reader) == [b'{"a": 1}', b'{"b": 2}', b'{"c": 3}']
+
+
+async def test_read_lines_handles_lines_over_stream_limit():
+    """Test that lines longer than the reader's limit do not raise."""
+    payload = b"x" * (1 << 20)
+    reader = asyncio.StreamReader(limit=1024)
+    reader.feed_data(payload + b"\n")
+    reader.feed_eof()
+    assert await _collect(reader) == [payload]
+
+
+async def test_read_lines_reassembles_long_line_from_small_chunks():
+    """Test that a line spanning many reads is reassembled without losing data."""
+    payload = bytes(range(10)) * (1 << 17)
+    chunks = [payload[i:i + 4096] for i in range(0, len(payload), 4096)]
+    reader = _reader(b"first\n", *chunks, b"\nlast\n")
+    assert await _collect(reader) == [b"first", payload, b"last"]
+
+
+async def test_read_lines_empty_stream():
+    """Test that an empty stream yields nothing."""
+    assert await _collect(_reader()) == []
+
+
+async def test_read_line_batches_groups_lines_per_read():
+    """Test that lines available from a single read are yielded together."""
+    reader = _reader(b'{"a": 1}\n{"b": 2}\n{"c"')
+    batches = [batch async for batch in _read_line_batches(reader)]
+    assert batches == [[b'{"a": 1}', b'{"b": 2}'], [b'{"c"']]
+
+
+async def test_drain_stderr_keeps_recent_lines():
+    """Test that only the tail of a long stderr stream is retained."""
+    lines = b"".join(b"line %d\n" % i for i in range(1000))
+    tail = await _drain_stderr(_reader(lines))
+    assert len(tail) == exec_module._STDERR_TAIL_LINES
+    assert tail[-1] == b"line 999"
+
+
+async def test_drain_stderr_bounds_unterminated_output():
+    """Test that stderr without newlines only keeps its most recent bytes."""
+    progress = [b"\rprogress %d%%" % (i % 100) for i in range(100000)]
+    tail = await _drain_stderr(_reader(*progress))
+    assert len(tail) == 1
+    assert len(tail[0]) <= exec_module._STDERR_MAX_LINE_BYTES
+    assert tail[0].endswith(b"\rprogress 99%")
+
+
+def _fake_cli(tmp_path, body: str) -> str:
+    """Write an executable Python script standing in for the codex binary."""
+    script = tmp_path / "codex"
+    script.write_text(f"#!{sys.executable}\nimport sys\n{body}")
+    script.chmod(0o755)
+    return str(script)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires executable scripts")
+async def test_run_batched_writes_large_prompt_while_reading_stdout(tmp_path):
+    """Test that a CLI writing lots of output before reading its prompt does not deadlock."""
+    # More output than even an enlarged stdout pipe holds, so the CLI blocks until it is read
+    cli = _fake_cli(tmp_path, (
+        "for i in range(20000):\n"
+        "    sys.stdout.write('{\"type\": \"item.updated\", \"pad\": \"%s\"}\\n' % ('x' * 64))\n"
+        "sys.stdout.flush()\n"
+        "data = sys.stdin.buffer.read()\n"
+        "print('{\"type\": \"turn.completed\", \"size\": %d}' % len(data))\n"
+    ))
+    prompt = "p" * (4 << 20)
+    
+    async def collect():
+        return [
+            line
+            async for batch in CodexExec(cli).run_batched(CodexExecArgs(input=prompt))
+            for line in batch
+        ]
+    
+    lines = await asyncio.wait_for(collect(), timeout=30)
+    assert len(lines) == 20001
+    assert lines[-1] == b'{"type": "turn.completed", "size": %d}' % len(prompt)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires executable scripts")
+async def test_run_batched_reports_stderr_tail_on_failure(tmp_path):
+    """Test that a failing CLI that ignores its prompt raises with the end of its stderr."""
+    cli = _fake_cli(tmp_path, (
+        "for i in range(1000):\n"
+        "    sys.stderr.write('error %d\\n' % i)\n"
+        "sys.exit(3)\n"
+    ))
+    with pytest.raises(RuntimeError, match="exited with code 3") as excinfo:
+        async for _ in CodexExec(cli).run_batched(CodexExecArgs(input="p" * (4 << 20))):
+            pass
+    
+    message = str(excinfo.value)
+    assert message.endswith("error 999")
+    assert "error 744\n" in message
+    assert "error 743\n" not in message
+
+
+def test_codex_path_lookup_is_cached(monkeypatch):
+    """Test that the binary lookup runs once per PATH across executors."""
+    lookups = []
+    
+    def fake_which(name):
+        lookups.append(name)
+        return "/opt/bin/codex"
+    
+    monkeypatch.setattr(exec_module, "_PATH_CACHE", {})
+    monkeypatch.setattr(exec_module.shutil, "which", fake_which)
+    monkeypatch.setenv("PATH", "/opt/bin")
+    
+    assert CodexExec().executable_path == "/opt/bin/codex"
+    assert CodexExec().executable_path == "/opt/bin/codex"
+    assert lookups == ["codex"]
+    
+    monkeypatch.setenv("PATH", "/other/bin")
+    CodexExec().executable_path
+    assert lookups == ["codex", "codex"]
+
+
+def test_codex_path_is_resolved_lazily(monkeypatch):
+    """Test that a missing binary only fails once the executor needs it."""
+    monkeypatch.setattr(exec_module, "_PATH_CACHE", {})
+    monkeypatch.setattr(exec_module.shutil, "which", lambda name: None)
+    monkeypatch.setattr(exec_module, "_SYSTEM", "plan9")
+    
+    codex_exec = CodexExec()
+    with pytest.raises(RuntimeError, match="Unsupported platform"):
+        codex_exec.executable_path
+
+
+def test_codex_path_can_be_assigned(monkeypatch):
+    """Test that an explicitly assigned binary path replaces the lookup."""
+    monkeypatch.setattr(exec_module.shutil, "which", lambda name: None)
+    monkeypatch.setattr(exec_module, "_SYSTEM", "plan9")
+    
+    codex_exec = CodexExec()
+    codex_exec.executable_path = "/custom/codex"
+    assert codex_exec.executable_path == "/custom/codex"
+
+
+def test_env_override_is_read_only():
+    """Test that the environment snapshot cannot be changed after construction."""
+    env = {"PATH": "/usr/bin"}
+    codex_exec = CodexExec(env=env)
+    env["CODEX_API_KEY"] = "late"
+    
+    assert dict(codex_exec.env_override) == {"PATH": "/usr/bin"}
+    with pytest.raises(TypeError):
+        codex_exec.env_override["CODEX_API_KEY"] = "late"
+    with pytest.raises(AttributeError):
+        codex_exec.env_override = {}
+    assert CodexExec().env_override is None
+
+
+def test_build_command_args_defaults():
+    """Test the command line for a turn without options."""
+    assert _build_command_args(CodexExecArgs(input="hi")) == ["exec", "--experimental-json"]
+
+
+def test_build_command_args_all_options():
+    """Test that every option is translated to its CLI flag."""
+    args = CodexExecArgs(
+        input="hi",
+        thread_id="thread-1",
+        images=["a.png", "b.png"],
+        model="gpt-5",
+        sandbox_mode="workspace-write",
+        working_directory="/work",
+        additional_directories=["/lib", "/data"],
+        skip_git_repo_check=True,
+        output_schema_file="/tmp/schema.json",
+        model_reasoning_effort="high",
+        network_access_enabled=False,
+        web_search_enabled=True,
+        approval_policy="never",
+    )
+    assert _build_command_args(args) == [
+        "exec", "--experimental-json",
+        "--model", "gpt-5",
+        "--sandbox", "workspace-write",
+        "--cd", "/work",
+        "--output-schema", "/tmp/schema.json",
+        "--add-dir", "/lib",
+        "--add-dir", "/data",
+        "--image", "a.png",
+        "--image", "b.png",
+        "--skip-git-repo-check",
+        "--config", 'model_reasoning_effort="high"',
+        "--config", "sandbox_workspace_write.network_access=false",
+        "--config", "features.web_search_request=true",
+        "--config", 'approval_policy="never"',
+        "resume", "thread-1",
+    ]
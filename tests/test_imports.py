@@ -1,116 +1,116 @@
 """Test that all package imports work correctly."""
 
+from types import SimpleNamespace
+
 import pytest
 
 
-def test_package_imports():
-    """Test that the package can be imported."""
+@pytest.fixture(scope="session")
+def sdk():
+    """Import the package and its public symbols once per test session."""
     import codex_sdk
-    assert codex_sdk.__version__ == "0.1.0"
+    from codex_sdk import codex, thread
+    
+    return SimpleNamespace(
+        module=codex_sdk,
+        Codex=codex_sdk.Codex,
+        Thread=codex_sdk.Thread,
+        ThreadEvent=codex_sdk.ThreadEvent,
+        ThreadItem=codex_sdk.ThreadItem,
+        Usage=codex_sdk.Usage,
+        Turn=codex_sdk.Turn,
+        StreamedTurn=codex_sdk.StreamedTurn,
+        ThreadStartedEvent=codex_sdk.ThreadStartedEvent,
+        TurnStartedEvent=codex_sdk.TurnStartedEvent,
+        TurnCompletedEvent=codex_sdk.TurnCompletedEvent,
+        TurnFailedEvent=codex_sdk.TurnFailedEvent,
+        ItemStartedEvent=codex_sdk.ItemStartedEvent,
+        ItemUpdatedEvent=codex_sdk.ItemUpdatedEvent,
+        ItemCompletedEvent=codex_sdk.ItemCompletedEvent,
+        ThreadErrorEvent=codex_sdk.ThreadErrorEvent,
+        CommandExecutionItem=codex_sdk.CommandExecutionItem,
+        FileChangeItem=codex_sdk.FileChangeItem,
+        McpToolCallItem=codex_sdk.McpToolCallItem,
+        AgentMessageItem=codex_sdk.AgentMessageItem,
+        ReasoningItem=codex_sdk.ReasoningItem,
+        WebSearchItem=codex_sdk.WebSearchItem,
+        ErrorItem=codex_sdk.ErrorItem,
+        TodoListItem=codex_sdk.TodoListItem,
+        CodexOptions=codex.CodexOptions,
+        ThreadOptions=thread.ThreadOptions,
+        TurnOptions=thread.TurnOptions,
+    )
+
+
+def test_package_imports(sdk):
+    """Test that the package can be imported."""
+    assert sdk.module.__version__ == "0.1.0"
 
 
-def test_main_class_imports():
+def test_main_class_imports(sdk):
     """Test that main classes can be imported."""
-    from codex_sdk import Codex, Thread
-    assert Codex is not None
-    assert Thread is not None
+    assert sdk.Codex is not None
+    assert sdk.Thread is not None
 
 
-def test_type_imports():
+def test_type_imports(sdk):
     """Test that type definitions can be imported."""
-    from codex_sdk import (
-        ThreadEvent,
-        ThreadItem,
-        Usage,
-        Turn,
-        StreamedTurn,
-    )
-    assert ThreadEvent is not None
-    assert ThreadItem is not None
-    assert Usage is not None
-    assert Turn is not None
-    assert StreamedTurn is not None
+    assert sdk.ThreadEvent is not None
+    assert sdk.ThreadItem is not None
+    assert sdk.Usage is not None
+    assert sdk.Turn is not None
+    assert sdk.StreamedTurn is not None
 
 
-def test_event_type_imports():
+def test_event_type_imports(sdk):
     """Test that event types can be imported."""
-    from codex_sdk import (
-        ThreadStartedEvent,
-        TurnStartedEvent,
-        TurnCompletedEvent,
-        TurnFailedEvent,
-        ItemStartedEvent,
-        ItemUpdatedEvent,
-        ItemCompletedEvent,
-        ThreadErrorEvent,
-    )
-    assert ThreadStartedEvent is not None
-    assert TurnStartedEvent is not None
-    assert TurnCompletedEvent is not None
-    assert TurnFailedEvent is not None
-    assert ItemStartedEvent is not None
-    assert ItemUpdatedEvent is not None
-    assert ItemCompletedEvent is not None
-    assert ThreadErrorEvent is not None
+    assert sdk.ThreadStartedEvent is not None
+    assert sdk.TurnStartedEvent is not None
+    assert sdk.TurnCompletedEvent is not None
+    assert sdk.TurnFailedEvent is not None
+    assert sdk.ItemStartedEvent is not None
+    assert sdk.ItemUpdatedEvent is not None
+    assert sdk.ItemCompletedEvent is not None
+    assert sdk.ThreadErrorEvent is not None
 
 
-def test_item_type_imports():
+def test_item_type_imports(sdk):
     """Test that item types can be imported."""
-    from codex_sdk import (
-        CommandExecutionItem,
-        FileChangeItem,
-        McpToolCallItem,
-        AgentMessageItem,
-        ReasoningItem,
-        WebSearchItem,
-        ErrorItem,
-        TodoListItem,
-    )
-    assert CommandExecutionItem is not None
-    assert FileChangeItem is not None
-    assert McpToolCallItem is not None
-    assert AgentMessageItem is not None
-    assert ReasoningItem is not None
-    assert WebSearchItem is not None
-    assert ErrorItem is not None
-    assert TodoListItem is not None
+    assert sdk.CommandExecutionItem is not None
+    assert sdk.FileChangeItem is not None
+    assert sdk.McpToolCallItem is not None
+    assert sdk.AgentMessageItem is not None
+    assert sdk.ReasoningItem is not None
+    assert sdk.WebSearchItem is not None
+    assert sdk.ErrorItem is not None
+    assert sdk.TodoListItem is not None
 
 
-def test_codex_instantiation():
+def test_codex_instantiation(sdk):
     """Test that Codex can be instantiated with a mock path."""
-    from codex_sdk import Codex
-    from codex_sdk.codex import CodexOptions
-    
     # Use a mock path to avoid requiring the actual binary
-    options = CodexOptions(codex_path_override="/mock/path/to/codex")
-    codex = Codex(options=options)
+    options = sdk.CodexOptions(codex_path_override="/mock/path/to/codex")
+    codex = sdk.Codex(options=options)
     assert codex is not None
 
 
-def test_codex_options():
+def test_codex_options(sdk):
     """Test that CodexOptions can be used."""
-    from codex_sdk import Codex
-    from codex_sdk.codex import CodexOptions
-    
-    options = CodexOptions(
+    options = sdk.CodexOptions(
         codex_path_override="/mock/path/to/codex",
         base_url="https://api.example.com",
         api_key="test-key",
     )
-    codex = Codex(options=options)
+    codex = sdk.Codex(options=options)
     assert codex is not None
 
 
-def test_thread_options():
+def test_thread_options(sdk):
     """Test that ThreadOptions can be used."""
-    from codex_sdk import Codex
-    from codex_sdk.codex import CodexOptions
-    from codex_sdk.thread import ThreadOptions
-    
-    codex_options = CodexOptions(codex_path_override="/mock/path/to/codex")
-    codex = Codex(options=codex_options)
+    codex_options = sdk.CodexOptions(codex_path_override="/mock/path/to/codex")
+    codex = sdk.Codex(options=codex_options)
     
-    thread_options = ThreadOptions(
+    thread_options = sdk.ThreadOptions(
         model="gpt-4",
         sandbox_mode="read-only",
     )
@@ -119,15 +119,13 @@ def test_thread_options():
     assert thread.id is None  # ID is populated after first turn
 
 
-def test_turn_options():
+def test_turn_options(sdk):
     """Test that TurnOptions can be used."""
-    from codex_sdk.thread import TurnOptions
-    
     schema = {
         "type": "object",
         "properties": {
             "result": {"type": "string"}
         }
     }
-    options = TurnOptions(output_schema=schema)
+    options = sdk.TurnOptions(output_schema=schema)
     assert options.output_schema == schema
@@ -0,0 +1,141 @@
+"""Tests for thread event handling."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from codex_sdk.thread import Thread, TurnOptions, _event_type
+
+
+class FakeExec:
+    """Stand-in for CodexExec that replays canned JSONL batches."""
+    
+    def __init__(self, *batches):
+        self.batches = batches
+        self.calls = []
+    
+    async def run_batched(self, args):
+        self.calls.append(args)
+        if args.output_schema_file:
+            self.schema = json.loads(Path(args.output_schema_file).read_text())
+        for batch in self.batches:
+            yield [json.dumps(event).encode("utf-8") for event in batch]
+
+
+TURN_EVENTS = [
+    [
+        {"type": "thread.started", "thread_id": "thread-1"},
+        {"type": "turn.started"},
+    ],
+    [
+        {"type": "item.completed", "item": {"id": "0", "type": "reasoning", "text": "thinking"}},
+        {"type": "item.completed", "item": {"id": "1", "type": "agent_message", "text": "done"}},
+        {
+            "type": "turn.completed",
+            "usage": {"input_tokens": 3, "cached_input_tokens": 0, "output_tokens": 1},
+        },
+    ],
+]
+
+
+async def test_run_collects_turn():
+    """Test that run aggregates items, final response and usage."""
+    thread = Thread(FakeExec(*TURN_EVENTS))
+    turn = await thread.run("hello")
+    
+    assert thread.id == "thread-1"
+    assert turn["final_response"] == "done"
+    assert [item["id"] for item in turn["items"]] == ["0", "1"]
+    assert turn["usage"]["input_tokens"] == 3
+
+
+async def test_run_without_collecting_items():
+    """Test that items can be skipped while still reporting the final response."""
+    thread = Thread(FakeExec(*TURN_EVENTS))
+    turn = await thread.run("hello", collect_items=False)
+    
+    assert turn["final_response"] == "done"
+    assert turn["items"] == []
+    assert turn["usage"]["output_tokens"] == 1
+
+
+async def test_run_raises_on_turn_failure():
+    """Test that a failed turn raises with the reported message."""
+    thread = Thread(FakeExec([{"type": "turn.failed", "error": {"message": "boom"}}]))
+    with pytest.raises(RuntimeError, match="boom"):
+        await thread.run("hello")
+
+
+async def test_run_streamed_yields_events_in_order():
+    """Test that streamed events are flattened across batches."""
+    thread = Thread(FakeExec(*TURN_EVENTS))
+    result = thread.run_streamed("hello")
+    types = [event["type"] async for event in result["events"]]
+    assert types == [
+        "thread.started",
+        "turn.started",
+        "item.completed",
+        "item.completed",
+        "turn.completed",
+    ]
+
+
+async def test_run_streamed_raw_yields_original_lines():
+    """Test that raw streaming passes event bytes through with their type."""
+    exec = FakeExec(*TURN_EVENTS)
+    thread = Thread(exec)
+    events = [event async for event in thread.run_streamed_raw("hello")]
+    
+    assert thread.id == "thread-1"
+    assert [event_type for event_type, _ in events] == [
+        "thread.started",
+        "turn.started",
+        "item.completed",
+        "item.completed",
+        "turn.completed",
+    ]
+    assert json.loads(events[2][1]) == TURN_EVENTS[1][0]
+
+
+def test_event_type_falls_back_to_parsing():
+    """Test that the event type is found even when it is not the first key."""
+    assert _event_type(b'{"type":"turn.started"}') == "turn.started"
+    assert _event_type(b'{"usage": {}, "type": "turn.completed"}') == "turn.completed"
+
+
+async def test_invalid_event_raises():
+    """Test that malformed JSONL is reported as a RuntimeError."""
+    
+    class BadExec:
+        async def run_batched(self, args):
+            yield [b"not json"]
+    
+    thread = Thread(BadExec())
+    with pytest.raises(RuntimeError, match="Failed to parse event: not json"):
+        await thread.run("hello")
+
+
+async def test_output_schema_file_is_written_and_removed():
+    """Test that the output schema is passed through a temp file that is cleaned up."""
+    schema = {"type": "object", "properties": {"summary": {"type": "string"}}}
+    exec = FakeExec(*TURN_EVENTS)
+    thread = Thread(exec)
+    await thread.run("hello", TurnOptions(output_schema=schema))
+    
+    schema_file = exec.calls[0].output_schema_file
+    assert exec.schema == schema
+    assert not Path(schema_file).exists()
+
+
+def test_normalize_input():
+    """Test that structured input is split into prompt text and image paths."""
+    thread = Thread(FakeExec())
+    
+    assert thread._normalize_input("hi") == ("hi", [])
+    assert thread._normalize_input([{"type": "text", "text": "hi"}]) == ("hi", [])
+    assert thread._normalize_input([
+        {"type": "text", "text": "first"},
+        {"type": "local_image", "path": "a.png"},
+        {"type": "text", "text": "second"},
+    ]) == ("first\n\nsecond", ["a.png"])